@@ -21,13 +21,14 @@ import sys
 from typing import List
 
 from nfl.core import pull_json_data, transform_json_data, load_out_json_data
-from nfl.helpers.command_line import check_command_line_arguments
+from nfl.helpers.command_line import check_command_line_arguments, NFL_ASCII
 
 
 def main(argc: int, argv: List[str]):
     """Runs a pipeline to pull, transform, and dump nfl data."""
 
     check_command_line_arguments(argc, argv)
+    print(NFL_ASCII)
     start_date, delta = argv[1], argv[2]
 
     # pull data >>> transform pulled data >>> dump transformed data
@@ -15,22 +15,100 @@ take as input the returned value of the previous. This high level
 """
 
 import requests, os, json, datetime
-from typing import Dict, Optional, Tuple, List, Union
-
-from nfl.helpers.dictionaries import load_config_constants, filter_dictionary
-from nfl.helpers.dates import generate_end_date, split_datetime, add_date_and_time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - simdjson is an optional speedup
+    simdjson = None
+
+from nfl.helpers.dictionaries import load_config_constants
+from nfl.helpers.dates import generate_end_date, split_datetime
 from nfl.logger import Logger
-
-# _extract_scoreboard_fields_of_interest() and _extract_rankings_fields_of_interest()
-# rely some of the global scope constants below within their function bodies. Other
-# functions in core.py use these constants as default values of their formal params.
-API_KEY, SCOREBOARD, RANKINGS, OUTPUT_DIRECTORY = load_config_constants()
+import nfl.settings as settings
+
+# the config constants (API_KEY, SCOREBOARD, RANKINGS, OUTPUT_DIRECTORY) are loaded on
+# first use through _cfg() rather than at import, so importing core.py never touches
+# config.json. Functions default their formal params to None and resolve them from
+# the config at call time.
+_config = None
+
+# a single session shared by both endpoint helpers so connections (and their
+# TCP/TLS handshakes) are pooled and kept alive rather than rebuilt per request.
+# transient gateway errors are retried with a short backoff.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
 
 
 # our core data structure is a dict with string keys and string | list(string) values
 json_data = Dict[str, Union[str, List[str]]]
 
 
+class _Config(NamedTuple):
+    """Config constants, along with the fields of interest prepared for
+    filtering: the scoreboard fields in config order, to be looked up on
+    each event, and the ranking fields as a set for constant time
+    membership tests."""
+
+    api_key: str
+    scoreboard: json_data
+    rankings: json_data
+    output_directory: str
+    scoreboard_fields: Tuple[str, ...]
+    ranking_fields: FrozenSet[str]
+
+
+def _cfg() -> _Config:
+    """Loads the config constants on first call and reuses them after.
+
+    :returns: the API_KEY, SCOREBOARD, RANKINGS, and OUTPUT_DIRECTORY
+        config values, plus the scoreboard and rankings fields of interest.
+    """
+
+    global _config
+
+    if _config is None:
+        api_key, scoreboard, rankings, output_directory = load_config_constants()
+        _config = _Config(
+            api_key=api_key,
+            scoreboard=scoreboard,
+            rankings=rankings,
+            output_directory=output_directory,
+            scoreboard_fields=tuple(scoreboard["fields_of_interest"]),
+            ranking_fields=frozenset(rankings["fields_of_interest"]),
+        )
+
+    return _config
+
+
 def _extract_scoreboard_fields_of_interest(
     complete_scoreboard_data: json_data,
 ) -> List[json_data]:
@@ -44,18 +122,25 @@ def _extract_scoreboard_fields_of_interest(
     :returns: a list of dictionaries representing filtered scoreboard data.
     """
 
-    scoreboard_fields_of_interest = SCOREBOARD["fields_of_interest"]
+    scoreboard_fields = _cfg().scoreboard_fields
     filtered_scoreboard_data = []
 
-    # filter results keeping only fields specified in config.json
-    for entry in complete_scoreboard_data:
-        if (event_results := complete_scoreboard_data[entry]) :
-            for event_id, event_data in event_results["data"].items():
-                filtered_event_data = filter_dictionary(
-                    event_data, scoreboard_fields_of_interest
-                )
-                filtered_event_data.update({"event_id": event_id})
-                filtered_scoreboard_data.append(filtered_event_data)
+    # filter results keeping only fields specified in config.json. Day buckets and
+    # events are indexed by key rather than iterated with .values() or .items(),
+    # and only the fields of interest are looked up on each event, so a lazily
+    # parsed simdjson response never turns the unused fields into python objects.
+    for day in complete_scoreboard_data:
+        event_results = complete_scoreboard_data[day]
+        if event_results:
+            events = event_results["data"]
+            filtered_scoreboard_data.extend(
+                {
+                    **{k: event[k] for k in scoreboard_fields if k in event},
+                    "event_id": event_id,
+                }
+                for event_id in events
+                for event in (events[event_id],)
+            )
 
     return filtered_scoreboard_data
 
@@ -69,22 +154,20 @@ def _extract_rankings_fields_of_interest(
     :returns: a list of dictionaries representing filtered ranking data.
     """
 
-    rankings_fields_of_interest = RANKINGS["fields_of_interest"]
-    filtered_ranking_data = []
+    ranking_fields = _cfg().ranking_fields
 
     # filter results keeping only fields specified in config.json
-    for team_data in complete_rankings_data["data"]:
-        filtered_team_data = filter_dictionary(team_data, rankings_fields_of_interest)
-        filtered_ranking_data.append(filtered_team_data)
-
-    return filtered_ranking_data
+    return [
+        {k: v for k, v in team_data.items() if k in ranking_fields}
+        for team_data in complete_rankings_data["data"]
+    ]
 
 
 def _pull_scoreboard_data(
     start_date: str,
     delta: str,
-    endpoint: Optional[str] = SCOREBOARD["endpoint"],
-    api_key: Optional[str] = API_KEY,
+    endpoint: Optional[str] = None,
+    api_key: Optional[str] = None,
 ) -> List[json_data]:
     """Retrieves and filters data from scoreboard endpoint of nfl api.
 
@@ -95,11 +178,16 @@ def _pull_scoreboard_data(
     :param delta: The number of days worth of data to pull. Delta
         must be between 0 and 7 days inclusive.
     :param endpoint: The incomplete scoreboard enpoint, not including
-        the start and end dates.
-    :param api_key: An api key to access the nfl api.
+        the start and end dates. Defaults to the config endpoint.
+    :param api_key: An api key to access the nfl api. Defaults to the
+        config API_KEY.
     :returns: a list of dictionaries representing all scoreboard data.
     """
 
+    config = _cfg()
+    endpoint = endpoint or config.scoreboard["endpoint"]
+    api_key = api_key or config.api_key
+
     endpoint, extension = os.path.splitext(endpoint)
     end_date = generate_end_date(start_date, delta)
     endpoint_with_dates_imputed = (
@@ -107,12 +195,17 @@ def _pull_scoreboard_data(
     )
 
     try:
-        response = requests.get(
-            endpoint_with_dates_imputed, params={"api_key": API_KEY}
+        response = _SESSION.get(
+            endpoint_with_dates_imputed, params={"api_key": api_key}
         )
 
         if response.ok:
-            response = response.json()
+            if simdjson is not None:
+                # a lazy document; _extract_scoreboard_fields_of_interest() only
+                # materializes the fields of interest of each event
+                response = simdjson.Parser().parse(response.content)
+            else:
+                response = response.json()
             scoreboard_results = response["results"]
             filtered_scoreboard_data = _extract_scoreboard_fields_of_interest(
                 scoreboard_results
@@ -126,17 +219,23 @@ def _pull_scoreboard_data(
 
 
 def _pull_team_rankings(
-    endpoint: Optional[str] = RANKINGS["endpoint"], api_key: Optional[str] = API_KEY
+    endpoint: Optional[str] = None, api_key: Optional[str] = None
 ) -> List[json_data]:
     """Retrieves and filters data from rankings endpoint of nfl api.
 
     :param endpoint: The incomplete scoreboard enpoint, not including
-        the start and end dates.
-    :param api_key: An api key to access the nfl api.
+        the start and end dates. Defaults to the config endpoint.
+    :param api_key: An api key to access the nfl api. Defaults to the
+        config API_KEY.
     :returns: a list of dictionaries representing all rankings data.
     """
+
+    config = _cfg()
+    endpoint = endpoint or config.rankings["endpoint"]
+    api_key = api_key or config.api_key
+
     try:
-        response = requests.get(endpoint, params={"api_key": API_KEY})
+        response = _SESSION.get(endpoint, params={"api_key": api_key})
 
         if response.ok:
             response = response.json()
@@ -170,11 +269,15 @@ def pull_json_data(
     :returns: a tuple of lists containing scoreboard and rankings data.
     """
 
-    scoreboard_data = None
-
     try:
-        scoreboard_data = _pull_scoreboard_data(start_date, delta)
-        team_ranking_data = _pull_team_rankings()
+        # the two endpoints are independent, so request them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            scoreboard_future = executor.submit(
+                _pull_scoreboard_data, start_date, delta
+            )
+            team_ranking_future = executor.submit(_pull_team_rankings)
+            scoreboard_data = scoreboard_future.result()
+            team_ranking_data = team_ranking_future.result()
     except ValueError as ve:
         msg = "Please pass a correct starting date, such as 2000-12-20."
         msg = f"{ve}. {msg}"
@@ -182,15 +285,15 @@ def pull_json_data(
     except TypeError:
         msg = "Must pass a time delta between 0 and 7 days (inclusive)."
         raise ValueError(msg)
-    finally:
-        if not scoreboard_data:
-            msg = (
-                "No scoreboard data was returned for the specified "
-                "starting date and delta provided. Either no data exists, "
-                "or a date out of range was entered by mistake. Please check "
-                "that the starting date provided is correct."
-            )
-            raise ValueError(msg)
+
+    if not scoreboard_data:
+        msg = (
+            "No scoreboard data was returned for the specified "
+            "starting date and delta provided. Either no data exists, "
+            "or a date out of range was entered by mistake. Please check "
+            "that the starting date provided is correct."
+        )
+        raise ValueError(msg)
 
     return scoreboard_data, team_ranking_data
 
@@ -198,7 +301,7 @@ def pull_json_data(
 @Logger
 def transform_json_data(
     scoreboard_data: List[json_data], team_rankings: List[json_data]
-) -> List[json_data]:
+) -> Iterator[json_data]:
     """Combines scoreboard and teamrankings data and reorders fields.
 
     The raw date pulled from the scoreboard endpoint contains a time
@@ -206,69 +309,137 @@ def transform_json_data(
     split into their own fields (date & time).
 
     A number of keys are assumed to exist in the input data, matching
-    the nfl api response.
+    the nfl api response. Each output dictionary is built once, already
+    in the output key order; the input events are left unmodified.
+
+    As this is a generator, the work happens as the result is consumed,
+    which is after @Logger records the "Ran: transform_json_data" entry.
 
     :param scoreboard_data: scoreboard data post filtering.
     :param team_rankings: team rankings data post filtering.
-    :returns: a list of dictionaries which are the combined scoreboard
-        and rankings data.
+    :returns: a generator of dictionaries which are the combined scoreboard
+        and rankings data, produced one event at a time.
     """
 
-    transformed_result_list = []
-    desired_key_order = [
-        "event_id",
-        "event_date",
-        "event_time",
-        "away_team_id",
-        "away_nick_name",
-        "away_city",
-        "away_rank",
-        "away_rank_points",
-        "home_team_id",
-        "home_nick_name",
-        "home_city",
-        "home_rank",
-        "home_rank_points",
-    ]
-    # split default datetime field into two seperate fields (date & time)
-    scoreboard_data = add_date_and_time(scoreboard_data)
+    # index rankings by team id so each event is matched in constant time
+    rank_index = {
+        team["team_id"]: (team["rank"], team["adjusted_points"])
+        for team in team_rankings
+    }
+    missing_rank = (None, None)
+
+    # local bindings for the per-event calls below
+    get_rank, split = rank_index.get, split_datetime
 
-    # match appropriate rankings data with each event
     for event in scoreboard_data:
-        away_team_id, home_team_id = event["away_team_id"], event["home_team_id"]
-        for team in team_rankings:
-            if away_team_id == team["team_id"]:
-                away_team_rank, away_team_points = team["rank"], team["adjusted_points"]
-            elif home_team_id == team["team_id"]:
-                home_team_rank, home_team_points = team["rank"], team["adjusted_points"]
+        # split default datetime field into two seperate fields (date & time)
+        try:
+            event_date, event_time = split(event["event_date"])
+        except KeyError:
+            msg = (
+                "event_date column not present in response fields provided. "
+                "Check config.json to ensure it was not removed from "
+                "SCOREBOARD['fields_of_interest']."
+            )
+            raise KeyError(msg)
+
+        # match appropriate rankings data with each event
+        away_team_rank, away_team_points = get_rank(event["away_team_id"], missing_rank)
+        home_team_rank, home_team_points = get_rank(event["home_team_id"], missing_rank)
+
+        # build the combined event directly in the desired key ordering of our output
+        yield {
+            "event_id": event["event_id"],
+            "event_date": event_date,
+            "event_time": event_time,
+            "away_team_id": event["away_team_id"],
+            "away_nick_name": event["away_nick_name"],
+            "away_city": event["away_city"],
+            "away_rank": away_team_rank,
+            "away_rank_points": away_team_points,
+            "home_team_id": event["home_team_id"],
+            "home_nick_name": event["home_nick_name"],
+            "home_city": event["home_city"],
+            "home_rank": home_team_rank,
+            "home_rank_points": home_team_points,
+        }
+
+
+def _stream_json_array(
+    outfile,
+    items: Iterable[json_data],
+    dumps: Callable,
+    delimiters: Tuple[Union[str, bytes], ...],
+) -> None:
+    """Writes items to a file as a json array, one item at a time.
 
-        # update scoreboard data with rankings data
-        event["away_rank"], event["away_rank_points"] = away_team_rank, away_team_points
-        event["home_rank"], event["home_rank_points"] = home_team_rank, home_team_points
+    :param outfile: an open file to write to.
+    :param items: the items making up the array.
+    :param dumps: serializes a single item.
+    :param delimiters: the opening, separating, and closing tokens of
+        the array, as str or bytes to match outfile.
+    """
 
-        # reorder keys to match the desired key ordering of our output
-        ordered_output = {key: event[key] for key in desired_key_order}
-        transformed_result_list.append(ordered_output)
+    start, separator, end = delimiters
 
-    return transformed_result_list
+    outfile.write(start)
+    for index, item in enumerate(items):
+        if index:
+            outfile.write(separator)
+        outfile.write(dumps(item))
+    outfile.write(end)
 
 
 @Logger
 def load_out_json_data(
-    combined_data: json_data, output_dir: Optional[str] = OUTPUT_DIRECTORY
+    combined_data: Iterable[json_data],
+    output_dir: Optional[str] = None,
+    pretty: Optional[bool] = False,
 ) -> None:
     """Dumps final formatted data to a json file.
 
+    Compact output is serialized and written one event at a time, so
+    the combined data is never held in memory as a whole. Pretty
+    output needs the full document and collects the events first.
+
+    The file is written under a temporary name and only moved into
+    place once every event has been written, so an error raised while
+    producing combined_data leaves no partial json file behind.
+
     :param combined_data: combined scoreboard and rankings data
         after tranformations applied.
-    :param output_dir: a directory to dump to.
+    :param output_dir: a directory to dump to. Defaults to the config
+        OUTPUT_DIRECTORY.
+    :param pretty: indent the json for human readers, otherwise it
+        is written compactly.
     """
 
+    output_dir = output_dir or _cfg().output_directory
     filename = str(datetime.datetime.now())
+    output_file = os.path.join(output_dir, f"{filename}.json")
+    partial_file = f"{output_file}.part"
+    buffer_size = settings.WRITE_BUFFER_SIZE
 
-    with open(f"{output_dir}{filename}.json", "w") as outfile:
-        json.dump(
-            combined_data,
-            outfile,
-            indent=4,
-        )
+    try:
+        if orjson is not None:
+            with open(partial_file, "wb", buffering=buffer_size) as outfile:
+                if pretty:
+                    outfile.write(
+                        orjson.dumps(list(combined_data), option=orjson.OPT_INDENT_2)
+                    )
+                else:
+                    delimiters = (b"[", b",", b"]")
+                    _stream_json_array(outfile, combined_data, orjson.dumps, delimiters)
+        else:
+            with open(partial_file, "w", buffering=buffer_size) as outfile:
+                if pretty:
+                    json.dump(list(combined_data), outfile, indent=2)
+                else:
+                    delimiters = ("[", ", ", "]")
+                    _stream_json_array(outfile, combined_data, json.dumps, delimiters)
+    except BaseException:
+        if os.path.exists(partial_file):
+            os.remove(partial_file)
+        raise
+
+    os.replace(partial_file, output_file)
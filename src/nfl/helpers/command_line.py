@@ -1,11 +1,23 @@
 """
 command_line.py
 
-Checks for improper command line arguments passed by user.
+Checks for improper command line arguments passed by user and
+provides the banner shown once they have been accepted.
 """
 
+import re
 from typing import List
 
+_START_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+NFL_ASCII = (
+    "    _   __________               ______________  ___________ \n"
+    "   / | / / ____/ /      __/|_   / ___/_  __/   |/_  __/ ___/ \n"
+    "  /  |/ / /_  / /      |    /   \\__ \\ / / / /| | / /  \\__ \\ \n"
+    " / /|  / __/ / /___   /_ __|   ___/ // / / ___ |/ /  ___/ / \n"
+    "/_/ |_/_/   /_____/    |/     /____//_/ /_/  |_/_/  /____/ "
+)
+
 
 def check_command_line_arguments(argc: int, argv: List[str]) -> None:
     """Checks the user input the proper command line args.
@@ -28,23 +40,14 @@ def check_command_line_arguments(argc: int, argv: List[str]) -> None:
         )
         raise ValueError(msg)
 
-    if not len(argv[1].split("-")) == 3:
+    if not _START_DATE_PATTERN.fullmatch(argv[1]):
         msg = (
             "Please pass a starting date (including a year, month, "
             "and date) in the following format: YYYY-MM-DD."
         )
         raise ValueError(msg)
 
-    if not int(argv[2]) in range(0, 8):
+    if not 0 <= int(argv[2]) <= 7:
         msg = "The delta provided must be between 0 and 7 days inclusive."
         raise ValueError(msg)
 
-    nfl_ascii = (
-        "    _   __________               ______________  ___________ \n"
-        "   / | / / ____/ /      __/|_   / ___/_  __/   |/_  __/ ___/ \n"
-        "  /  |/ / /_  / /      |    /   \__ \ / / / /| | / /  \__ \ \n"
-        " / /|  / __/ / /___   /_ __|   ___/ // / / ___ |/ /  ___/ / \n"
-        "/_/ |_/_/   /_____/    |/     /____//_/ /_/  |_/_/  /____/ "
-    )
-
-    print(nfl_ascii)
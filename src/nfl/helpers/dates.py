@@ -2,15 +2,57 @@
 dates.py
 
 Provides functionality for working with dates such as generating
-an end date based on a start date and a delta, splitting a datetime
-field into seperate date and time fields, as well as adding date 
-and time keys, value pairs to a dictionary containing a datetime field.
+an end date based on a start date and a delta, as well as splitting
+a datetime field into seperate date and time fields.
 """
 
-from typing import Optional, Tuple, List, Dict, Union
-from datetime import datetime, timedelta
+from calendar import monthrange
+from typing import Optional, Tuple
+from datetime import date, datetime, timedelta
 
-json_data = Dict[str, Union[str, List[str]]]
+# formats with a fixed layout which can be handled by slicing the string directly
+_DEFAULT_DATE_FORMAT = "%Y-%m-%d"
+_DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# bound once to skip the attribute lookup on each parse/format call
+_strptime = datetime.strptime
+_strftime = datetime.strftime
+
+
+def _is_default_date(value: str) -> bool:
+    """Checks that value starts with a date laid out as YYYY-MM-DD."""
+
+    return (
+        len(value) >= 10
+        and value[4] == value[7] == "-"
+        and value[0:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:10].isdigit()
+    )
+
+
+def _is_default_datetime(value: str) -> bool:
+    """Checks that value is a valid datetime laid out as YYYY-MM-DD HH:MM."""
+
+    if not (
+        len(value) == 16
+        and _is_default_date(value)
+        and value[10] == " "
+        and value[13] == ":"
+        and value[11:13].isdigit()
+        and value[14:16].isdigit()
+    ):
+        return False
+
+    year, month, day = int(value[0:4]), int(value[5:7]), int(value[8:10])
+
+    return (
+        year >= 1
+        and 1 <= month <= 12
+        and 1 <= day <= monthrange(year, month)[1]
+        and int(value[11:13]) < 24
+        and int(value[14:16]) < 60
+    )
 
 
 def generate_end_date(
@@ -24,8 +66,21 @@ def generate_end_date(
     :returns: A string representing the end date.
     """
 
-    start_date = datetime.strptime(start_date, date_format)
-    end_date = datetime.strftime(start_date + timedelta(days=int(delta)), date_format)
+    # fast path: YYYY-MM-DD can be read by position without strptime
+    if (
+        date_format == _DEFAULT_DATE_FORMAT
+        and len(start_date) == 10
+        and _is_default_date(start_date)
+    ):
+        start_date = date(
+            int(start_date[0:4]), int(start_date[5:7]), int(start_date[8:10])
+        )
+        end_date = (start_date + timedelta(days=int(delta))).isoformat()
+
+        return end_date
+
+    start_date = _strptime(start_date, date_format)
+    end_date = _strftime(start_date + timedelta(days=int(delta)), date_format)
 
     return end_date
 
@@ -40,37 +95,16 @@ def split_datetime(
     :returns: A tuple of strings reprsenting the date and time.
     """
 
-    fulldate = datetime.strptime(date_time, datetime_format)
-    date = fulldate.strftime("%d-%m-%Y")
-    time = fulldate.strftime("%H:%M")
-
-    return date, time
-
+    # fast path: YYYY-MM-DD HH:MM can be split and reordered by position
+    if datetime_format == _DEFAULT_DATETIME_FORMAT and _is_default_datetime(date_time):
+        year, month, day = date_time[0:4], date_time[5:7], date_time[8:10]
+        time = date_time[11:16]
 
-def add_date_and_time(response_data: List[json_data]) -> List[json_data]:
-    """Adds date and time key,value pairs to a list of dictionaries.
+        return f"{day}-{month}-{year}", time
 
-    It is assumed that each dictionary contains an "event_date"
-    key, matching the response from the scoreboard endpoint of
-    the nfl api.
+    fulldate = _strptime(date_time, datetime_format)
+    date_part = fulldate.strftime("%d-%m-%Y")
+    time = fulldate.strftime("%H:%M")
 
-    :param reponse_data: A list of dictionaries representing event
-        data pulled from the nfl scorebord endpoint.
-    :raises:
-        KeyError: if event_date key not found.
-    :returns: list of event data with date and time added.
-    """
+    return date_part, time
 
-    for response in response_data:
-        try:
-            event_date, event_time = split_datetime(response["event_date"])
-            response["event_date"], response["event_time"] = event_date, event_time
-        except KeyError:
-            msg = (
-                "event_date column not present in response fields provided. "
-                "Check config.json to ensure it was not removed from "
-                "SCOREBOARD['fields_of_interest']."
-            )
-            raise KeyError(msg)
-
-    return response_data
@@ -1,27 +1,49 @@
 """
 dictionaries.py
 
-Contains helper functions for loading the json config file
-and filtering dictionary keys.
+Contains helper functions for loading the json config file.
 """
-import json
-from typing import Optional, Tuple, List
+from functools import lru_cache
+from typing import Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+    import json
 
 import nfl.settings as settings
 
 
+@lru_cache(maxsize=None)
+def _read_config(config_dir: str) -> dict:
+    """Reads and parses a config json file, once per location.
+
+    :param config_dir: the location of the config file.
+    :returns: the parsed config json.
+    """
+
+    with open(config_dir, "rb") as json_file:
+        if orjson is not None:
+            return orjson.loads(json_file.read())
+
+        return json.load(json_file)
+
+
 def load_config_constants(
     *keys, config_dir: Optional[str] = settings.CONFIG_PATH
 ) -> Tuple[str]:
     """Loads and returns values of a config json file.
 
+    The config file is only read and parsed on the first call for a
+    given location; later calls reuse the parsed values.
+
     :param *keys: a variable number of keys to retrieve values for.
     :param config_dir: the location of the config file.
     :returns: a tuple of strings representing the config values.
     """
 
-    with open(config_dir) as json_file:
-        config_json = json.load(json_file)
+    config_json = _read_config(config_dir)
 
     if not keys:
         keys = ["API_KEY", "SCOREBOARD", "RANKINGS", "OUTPUT_DIRECTORY"]
@@ -34,13 +56,3 @@ def load_config_constants(
 
     return tuple(constants)
 
-
-def filter_dictionary(dictionary: dict, keys_to_keep: List[str]) -> dict:
-    """Removes unwanted key,value pairs from dict.
-
-    :param dictionary: a dictionary to filter.
-    :param keys_to_keep: keys of the dictionary to retain.
-    :returns: a filtered dictionary
-    """
-
-    return {key: value for key, value in dictionary.items() if key in keys_to_keep}
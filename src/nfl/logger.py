@@ -1,21 +1,54 @@
-import datetime
+import atexit
+import os
+import time
 
 import nfl.settings as settings
 
 
 class Logger:
+
+    # a single buffered handle shared by every decorated function, written
+    # out when the process exits rather than reopened on each call.
+    _log = None
+    _log_date = None
+
     def __init__(self, func):
         self.func = func
-        self.path = settings.LOG_PATH
+
+    @classmethod
+    def _open(cls, log_file, log_date):
+        if cls._log is not None:
+            cls._log.close()
+
+        cls._log = open(log_file, "a", buffering=settings.WRITE_BUFFER_SIZE)
+        cls._log_date = log_date
+
+    @classmethod
+    def _close(cls):
+        if cls._log is not None:
+            cls._log.close()
+            cls._log = None
+            cls._log_date = None
 
     def __call__(self, *args, **kwargs):
 
-        filename = str(datetime.datetime.today().date())
+        # one clock read per call, formatted only into the fields we write
+        now = time.localtime()
+        today = now[:3]
+
+        # the log file path only changes, and is only rebuilt, when the day does
+        if today != Logger._log_date:
+            filename = time.strftime("%Y-%m-%d", now)
+            Logger._open(os.path.join(settings.LOG_PATH, f"{filename}.txt"), today)
 
-        with open(f"{self.path}{filename}.txt", "a") as log:
-            log.write("\n")
-            log.write(f"Ran: {self.func.__name__} \n")
-            log.write(f"Ran at: {datetime.datetime.now()} \n")
-            log.write("\n")
+        log = Logger._log
+        log.write("\n")
+        log.write(f"Ran: {self.func.__name__} \n")
+        log.write(f"Ran at: {time.strftime('%Y-%m-%d %H:%M:%S', now)} \n")
+        log.write("\n")
 
         return self.func(*args, **kwargs)
+
+
+# registered once for the process, whichever handle is open at exit is flushed
+atexit.register(Logger._close)
@@ -1,2 +1,3 @@
 CONFIG_PATH = "src/nfl/config.json"
 LOG_PATH = "src/nfl/logs/"
+WRITE_BUFFER_SIZE = 1 << 20
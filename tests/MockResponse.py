@@ -1,18 +1,34 @@
 from typing import Dict, Union, List, Optional
-import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
 
 json_data = Dict[str, Union[str, List[str]]]
 
-with open("tests/static_response.json") as json_file:
-    response_body = json.load(json_file)
+# read once at import; the raw bytes back the mock's content attribute
+with open("tests/static_response.json", "rb") as json_file:
+    response_content = json_file.read()
+
+if orjson is not None:
+    response_body = orjson.loads(response_content)
+else:
+    response_body = json.loads(response_content)
 
 
 class MockScoreboardResponse:
     """Mock response json data from scoreboard endpoint."""
-    def __init__(self, body: Optional[json_data] = response_body):
+    def __init__(
+        self,
+        body: Optional[json_data] = response_body,
+        content: Optional[bytes] = response_content,
+    ):
         self.status_code = 200
         self.ok = True
         self.body = body
+        self.content = content
 
     def json(self):
         return self.body
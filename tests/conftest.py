@@ -0,0 +1,16 @@
+import pytest
+
+import nfl.settings as settings
+from nfl.logger import Logger
+
+
+@pytest.fixture(autouse=True)
+def log_to_tmp_path(tmp_path, monkeypatch):
+    """Points the Logger's log directory at tmp_path for each test."""
+
+    Logger._close()
+    monkeypatch.setattr(settings, "LOG_PATH", str(tmp_path))
+
+    yield
+
+    Logger._close()
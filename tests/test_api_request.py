@@ -1,16 +1,54 @@
 from unittest.mock import Mock, patch
 
-from nfl.core import _pull_scoreboard_data
+import pytest
+
+from nfl.core import (
+    _SESSION,
+    _extract_rankings_fields_of_interest,
+    _pull_scoreboard_data,
+    pull_json_data,
+)
 from tests.MockResponse import MockScoreboardResponse
 from tests.mock_config import mock_scoreboard_config
 
 
+class LazyObject(dict):
+    """Stands in for a lazily parsed simdjson object, recording the keys
+    looked up on it and failing if it is materialized with values() or
+    items()."""
+
+    def __init__(self, data, accessed):
+        super().__init__(data)
+        self.accessed = accessed
+
+    def __getitem__(self, key):
+        self.accessed.add(key)
+        return super().__getitem__(key)
+
+    def values(self):
+        raise AssertionError("lazy object materialized with values()")
+
+    def items(self):
+        raise AssertionError("lazy object materialized with items()")
+
+
+def lazy_document(value, accessed):
+    if isinstance(value, dict):
+        data = {k: lazy_document(v, accessed) for k, v in value.items()}
+        return LazyObject(data, accessed)
+    return value
+
+
 @patch("nfl.helpers.dictionaries.load_config_constants")
-@patch("nfl.core.requests.get")
+@patch("nfl.core._SESSION.get")
 def test_pull_scoreboard_data_response_exists(mock_response, mock_config):
 
     scorboard_mock = MockScoreboardResponse()
-    attrs = {"ok": scorboard_mock.ok, "json.return_value": scorboard_mock.json()}
+    attrs = {
+        "ok": scorboard_mock.ok,
+        "content": scorboard_mock.content,
+        "json.return_value": scorboard_mock.json(),
+    }
     mock_response.return_value = Mock(**attrs)
 
     mock_config = Mock()
@@ -22,13 +60,17 @@ def test_pull_scoreboard_data_response_exists(mock_response, mock_config):
 
 
 @patch("nfl.helpers.dictionaries.load_config_constants")
-@patch("nfl.core.requests.get")
+@patch("nfl.core._SESSION.get")
 def test_pull_scoreboard_data_retains_only_fields_of_interest(
     mock_response, mock_config
 ):
 
     scorboard_mock = MockScoreboardResponse()
-    attrs = {"ok": scorboard_mock.ok, "json.return_value": scorboard_mock.json()}
+    attrs = {
+        "ok": scorboard_mock.ok,
+        "content": scorboard_mock.content,
+        "json.return_value": scorboard_mock.json(),
+    }
     mock_response.return_value = Mock(**attrs)
 
     mock_config = Mock()
@@ -48,3 +90,127 @@ def test_pull_scoreboard_data_retains_only_fields_of_interest(
     ]
 
     assert all(field in fields_of_interest for event in res for field in event)
+
+
+@patch("nfl.core._pull_team_rankings")
+@patch("nfl.core._pull_scoreboard_data")
+def test_pull_json_data_returns_scoreboard_and_rankings(mock_scoreboard, mock_rankings):
+
+    mock_scoreboard.return_value = [{"event_id": "1233827"}]
+    mock_rankings.return_value = [{"team_id": "42"}]
+
+    scoreboard_data, team_ranking_data = pull_json_data("2020-01-12", "7")
+
+    mock_scoreboard.assert_called_once_with("2020-01-12", "7")
+    assert scoreboard_data == [{"event_id": "1233827"}]
+    assert team_ranking_data == [{"team_id": "42"}]
+
+
+@patch("nfl.core._SESSION.get")
+def test_pull_scoreboard_data_uses_passed_endpoint_and_api_key(mock_response):
+
+    scorboard_mock = MockScoreboardResponse()
+    attrs = {
+        "ok": scorboard_mock.ok,
+        "content": scorboard_mock.content,
+        "json.return_value": scorboard_mock.json(),
+    }
+    mock_response.return_value = Mock(**attrs)
+
+    _pull_scoreboard_data(
+        "2020-01-12", "7", endpoint="https://example.com/NFL.json", api_key="abc"
+    )
+
+    mock_response.assert_called_once_with(
+        "https://example.com/NFL/2020-01-12/2020-01-19.json", params={"api_key": "abc"}
+    )
+
+
+def test_extract_rankings_fields_of_interest_keeps_only_ranking_fields():
+
+    complete_rankings_data = {
+        "data": [
+            {
+                "team_id": "42",
+                "team": "Houston",
+                "rank": "25",
+                "adjusted_points": "-6.410",
+            },
+            {
+                "team_id": "63",
+                "team": "Kansas City",
+                "rank": "5",
+                "adjusted_points": "11.375",
+            },
+        ]
+    }
+
+    res = _extract_rankings_fields_of_interest(complete_rankings_data)
+
+    assert res == [
+        {"team_id": "42", "rank": "25", "adjusted_points": "-6.410"},
+        {"team_id": "63", "rank": "5", "adjusted_points": "11.375"},
+    ]
+
+
+@patch("nfl.core._pull_team_rankings")
+@patch("nfl.core._pull_scoreboard_data")
+def test_pull_json_data_no_scoreboard_data_raises(mock_scoreboard, mock_rankings):
+
+    mock_scoreboard.return_value = []
+    mock_rankings.return_value = [{"team_id": "42"}]
+
+    with pytest.raises(ValueError, match="No scoreboard data was returned"):
+        pull_json_data("2020-01-12", "7")
+
+
+@patch("nfl.core._pull_team_rankings")
+def test_pull_json_data_bad_start_date_reports_date_error(mock_rankings):
+
+    mock_rankings.return_value = [{"team_id": "42"}]
+
+    with pytest.raises(ValueError, match="Please pass a correct starting date"):
+        pull_json_data("2020-13-12", "7")
+
+
+@patch("nfl.core._SESSION.get")
+def test_pull_scoreboard_data_without_simdjson_matches(mock_response):
+
+    scorboard_mock = MockScoreboardResponse()
+    attrs = {
+        "ok": scorboard_mock.ok,
+        "content": scorboard_mock.content,
+        "json.return_value": scorboard_mock.json(),
+    }
+    mock_response.return_value = Mock(**attrs)
+
+    res = _pull_scoreboard_data("2020-01-12", "7")
+
+    with patch("nfl.core.simdjson", None):
+        fallback_res = _pull_scoreboard_data("2020-01-12", "7")
+
+    accessed = set()
+    mock_simdjson = Mock()
+    mock_simdjson.Parser.return_value.parse.return_value = lazy_document(
+        scorboard_mock.json(), accessed
+    )
+
+    with patch("nfl.core.simdjson", mock_simdjson):
+        lazy_res = _pull_scoreboard_data("2020-01-12", "7")
+
+    mock_response.return_value.json.assert_called()
+    assert fallback_res == res == lazy_res
+    assert len(fallback_res) == 4
+    # only the fields of interest are ever looked up on a lazily parsed event
+    assert not accessed & {"stadium", "away_name", "away_primary_color"}
+
+
+def test_session_retries_transient_gateway_errors():
+
+    adapter = _SESSION.get_adapter("https://delivery.chalk247.com/")
+
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.backoff_factor == 0.2
+    assert adapter.max_retries.status_forcelist == [502, 503, 504]
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 4
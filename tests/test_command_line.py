@@ -0,0 +1,26 @@
+import pytest
+
+from nfl.helpers.command_line import check_command_line_arguments
+
+
+def test_check_command_line_arguments_accepts_valid_args():
+
+    argv = ["main.py", "2020-01-12", "7"]
+
+    assert check_command_line_arguments(len(argv), argv) is None
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["main.py", "2020-01-12"],
+        ["main.py", "2020-1-12", "7"],
+        ["main.py", "12-01-2020", "7"],
+        ["main.py", "2020-01-12", "8"],
+        ["main.py", "2020-01-12", "-1"],
+    ],
+)
+def test_check_command_line_arguments_rejects_invalid_args(argv):
+
+    with pytest.raises(ValueError):
+        check_command_line_arguments(len(argv), argv)
@@ -0,0 +1,27 @@
+import pytest
+
+from nfl.core import _cfg
+from nfl.helpers.dictionaries import load_config_constants
+
+
+def test_load_config_constants_reuses_parsed_config():
+
+    first_scoreboard, = load_config_constants("SCOREBOARD")
+    second_scoreboard, = load_config_constants("SCOREBOARD")
+
+    assert first_scoreboard is second_scoreboard
+
+
+def test_load_config_constants_unknown_key_raises():
+
+    with pytest.raises(ValueError):
+        load_config_constants("NOT_A_KEY")
+
+
+def test_core_config_prepares_fields_of_interest_once():
+
+    config = _cfg()
+
+    assert _cfg().scoreboard_fields is config.scoreboard_fields
+    assert config.scoreboard_fields == tuple(config.scoreboard["fields_of_interest"])
+    assert config.ranking_fields == frozenset(config.rankings["fields_of_interest"])
@@ -0,0 +1,55 @@
+import pytest
+
+from nfl.helpers.dates import generate_end_date, split_datetime
+
+
+def test_generate_end_date_adds_delta():
+
+    assert generate_end_date("2020-01-12", "7") == "2020-01-19"
+    assert generate_end_date("2020-12-30", "3") == "2021-01-02"
+
+
+def test_generate_end_date_custom_format():
+
+    assert generate_end_date("12/01/2020", "7", "%d/%m/%Y") == "19/01/2020"
+
+
+@pytest.mark.parametrize("start_date", ["2020-13-12", "2020/01/12", "  20-01-12"])
+def test_generate_end_date_invalid_date_raises(start_date):
+
+    with pytest.raises(ValueError):
+        generate_end_date(start_date, "7")
+
+
+def test_split_datetime_returns_date_and_time():
+
+    assert split_datetime("2020-01-12 15:05") == ("12-01-2020", "15:05")
+    assert split_datetime("2020-02-29 23:59") == ("29-02-2020", "23:59")
+
+
+def test_split_datetime_custom_format():
+
+    assert split_datetime("12/01/2020 15:05", "%d/%m/%Y %H:%M") == (
+        "12-01-2020",
+        "15:05",
+    )
+
+
+@pytest.mark.parametrize(
+    "date_time",
+    [
+        "abcdefghijklmnop",
+        "2020/01/12 15:05",
+        "2020-01-12T15:05",
+        "2020-13-12 15:05",
+        "2020-02-30 15:05",
+        "0000-01-12 15:05",
+        "2020-01-12 25:00",
+        "2020-01-12 15:60",
+        "2020-13-45 99:99",
+    ],
+)
+def test_split_datetime_invalid_datetime_raises(date_time):
+
+    with pytest.raises(ValueError):
+        split_datetime(date_time)
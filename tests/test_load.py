@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from nfl.core import load_out_json_data
+
+
+def _combined_data():
+    return [
+        {"event_id": "1233827", "away_rank": "25", "home_rank": "5"},
+        {"event_id": "1233912", "away_rank": "10", "home_rank": "4"},
+    ]
+
+
+def test_load_out_json_data_writes_json_file(tmp_path):
+
+    load_out_json_data(_combined_data(), output_dir=str(tmp_path))
+
+    (output_file,) = tmp_path.glob("*.json")
+
+    assert json.loads(output_file.read_text()) == _combined_data()
+
+
+def test_load_out_json_data_pretty_is_indented(tmp_path):
+
+    load_out_json_data(_combined_data(), output_dir=str(tmp_path), pretty=True)
+
+    (output_file,) = tmp_path.glob("*.json")
+
+    assert output_file.read_text().startswith('[\n  {\n    "event_id"')
+    assert json.loads(output_file.read_text()) == _combined_data()
+
+
+def test_load_out_json_data_accepts_a_generator(tmp_path):
+
+    load_out_json_data(iter(_combined_data()), output_dir=str(tmp_path))
+
+    (output_file,) = tmp_path.glob("*.json")
+
+    assert json.loads(output_file.read_text()) == _combined_data()
+
+
+def test_load_out_json_data_empty_data_writes_empty_array(tmp_path):
+
+    load_out_json_data(iter([]), output_dir=str(tmp_path))
+
+    (output_file,) = tmp_path.glob("*.json")
+
+    assert json.loads(output_file.read_text()) == []
+
+
+def test_load_out_json_data_failing_data_leaves_no_file(tmp_path):
+    def failing_data():
+        yield _combined_data()[0]
+        raise KeyError("event_date")
+
+    with pytest.raises(KeyError):
+        load_out_json_data(failing_data(), output_dir=str(tmp_path))
+
+    assert not list(tmp_path.glob("*.json*"))
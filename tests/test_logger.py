@@ -0,0 +1,71 @@
+import re
+import time
+from unittest.mock import patch
+
+from nfl.logger import Logger
+
+
+@Logger
+def first_task():
+    return "first"
+
+
+@Logger
+def second_task():
+    return "second"
+
+
+def test_logger_returns_wrapped_result():
+
+    assert first_task() == "first"
+
+
+def test_logger_calls_share_one_handle(tmp_path):
+
+    first_task()
+    log = Logger._log
+    second_task()
+
+    assert Logger._log is log
+
+    Logger._close()
+    (log_file,) = tmp_path.glob("*.txt")
+    contents = log_file.read_text()
+
+    assert "Ran: first_task" in contents
+    assert "Ran: second_task" in contents
+
+
+def test_logger_reopens_on_day_change(tmp_path):
+
+    first_day = time.strptime("2020-01-12 23:59:59", "%Y-%m-%d %H:%M:%S")
+    second_day = time.strptime("2020-01-13 00:00:01", "%Y-%m-%d %H:%M:%S")
+
+    with patch("nfl.logger.time.localtime", return_value=first_day):
+        first_task()
+    log = Logger._log
+
+    with patch("nfl.logger.time.localtime", return_value=second_day):
+        second_task()
+
+    assert Logger._log is not log
+    assert log.closed
+
+    Logger._close()
+
+    assert "Ran: first_task" in (tmp_path / "2020-01-12.txt").read_text()
+    assert "Ran: second_task" in (tmp_path / "2020-01-13.txt").read_text()
+
+
+def test_logger_ran_at_format(tmp_path):
+
+    first_task()
+    Logger._close()
+
+    (log_file,) = tmp_path.glob("*.txt")
+
+    assert re.search(
+        r"^Ran at: \d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} $",
+        log_file.read_text(),
+        re.MULTILINE,
+    )
@@ -0,0 +1,79 @@
+from nfl.core import transform_json_data
+
+
+def _scoreboard_data():
+    return [
+        {
+            "event_id": "1233827",
+            "event_date": "2020-01-12 15:05",
+            "away_team_id": "42",
+            "away_nick_name": "Texans",
+            "away_city": "Houston",
+            "home_team_id": "63",
+            "home_nick_name": "Chiefs",
+            "home_city": "Kansas City",
+        }
+    ]
+
+
+def _team_rankings():
+    return [
+        {"team_id": "63", "rank": "5", "adjusted_points": "11.375"},
+        {"team_id": "42", "rank": "25", "adjusted_points": "-6.410"},
+    ]
+
+
+def test_transform_json_data_matches_rankings_to_teams():
+
+    res = list(transform_json_data(_scoreboard_data(), _team_rankings()))
+
+    assert res == [
+        {
+            "event_id": "1233827",
+            "event_date": "12-01-2020",
+            "event_time": "15:05",
+            "away_team_id": "42",
+            "away_nick_name": "Texans",
+            "away_city": "Houston",
+            "away_rank": "25",
+            "away_rank_points": "-6.410",
+            "home_team_id": "63",
+            "home_nick_name": "Chiefs",
+            "home_city": "Kansas City",
+            "home_rank": "5",
+            "home_rank_points": "11.375",
+        }
+    ]
+    assert list(res[0]) == [
+        "event_id",
+        "event_date",
+        "event_time",
+        "away_team_id",
+        "away_nick_name",
+        "away_city",
+        "away_rank",
+        "away_rank_points",
+        "home_team_id",
+        "home_nick_name",
+        "home_city",
+        "home_rank",
+        "home_rank_points",
+    ]
+
+
+def test_transform_json_data_unranked_team_has_no_rank():
+
+    res = list(transform_json_data(_scoreboard_data(), _team_rankings()[:1]))
+
+    assert res[0]["away_rank"] is None
+    assert res[0]["away_rank_points"] is None
+    assert res[0]["home_rank"] == "5"
+
+
+def test_transform_json_data_does_not_mutate_input_events():
+
+    scoreboard_data = _scoreboard_data()
+
+    list(transform_json_data(scoreboard_data, _team_rankings()))
+
+    assert scoreboard_data == _scoreboard_data()